@@ -12,6 +12,56 @@ import re
 import threading
 import signal
 import json
+import time
+import shutil
+import filecmp
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+if platform.system() == "Windows":
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.CreateJobObjectW.argtypes = (ctypes.c_void_p, wintypes.LPCWSTR)
+    _kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+    _kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.AssignProcessToJobObject.argtypes = (wintypes.HANDLE, wintypes.HANDLE)
+    _kernel32.AssignProcessToJobObject.restype = wintypes.BOOL
+    _kernel32.QueryInformationJobObject.argtypes = (wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p,
+                                                    wintypes.DWORD, ctypes.POINTER(wintypes.DWORD))
+    _kernel32.QueryInformationJobObject.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+
+    class _JobBasicAccounting(ctypes.Structure):
+        """JOBOBJECT_BASIC_ACCOUNTING_INFORMATION"""
+        _fields_ = [
+            ("TotalUserTime", ctypes.c_int64),
+            ("TotalKernelTime", ctypes.c_int64),
+            ("ThisPeriodTotalUserTime", ctypes.c_int64),
+            ("ThisPeriodTotalKernelTime", ctypes.c_int64),
+            ("TotalPageFaultCount", wintypes.DWORD),
+            ("TotalProcesses", wintypes.DWORD),
+            ("ActiveProcesses", wintypes.DWORD),
+            ("TotalTerminatedProcesses", wintypes.DWORD),
+        ]
+else:
+    _kernel32 = None
+
+_PROCESS_TERMINATE = 0x0001
+_PROCESS_SET_QUOTA = 0x0100
+_JOB_OBJECT_BASIC_ACCOUNTING = 1
+
+# Matches UBT/MSVC/clang diagnostics such as "Foo.cpp(12): error C2065:" or "LogInit: Warning:"
+_DIAGNOSTIC_RE = re.compile(r"(?:^|[\s:)])(error|warning)(?:\s+[A-Z]+\d+)?\s*:", re.IGNORECASE)
 
 class ToolTip:
     """Create tooltip for widgets."""
@@ -41,6 +91,300 @@ class ToolTip:
             self.tooltip = None
 
 
+def _open_process_job(pid):
+    """Put pid in a new Windows Job Object and return the job handle, or None.
+
+    Processes started by pid afterwards join the same job, and the job's
+    accounting keeps the CPU time of every member, including those that exited.
+    """
+    if _kernel32 is None:
+        return None
+    job = _kernel32.CreateJobObjectW(None, None)
+    if not job:
+        return None
+    process = _kernel32.OpenProcess(_PROCESS_SET_QUOTA | _PROCESS_TERMINATE, False, pid)
+    try:
+        if process and _kernel32.AssignProcessToJobObject(job, process):
+            return job
+    finally:
+        if process:
+            _kernel32.CloseHandle(process)
+    _kernel32.CloseHandle(job)
+    return None
+
+
+def _job_cpu_seconds(job):
+    """Total user + kernel time of every process that has been in the job, or None."""
+    info = _JobBasicAccounting()
+    if not _kernel32.QueryInformationJobObject(job, _JOB_OBJECT_BASIC_ACCOUNTING, ctypes.byref(info),
+                                               ctypes.sizeof(info), None):
+        return None
+    # Times are in 100 ns units
+    return (info.TotalUserTime + info.TotalKernelTime) / 1e7
+
+
+def _process_tree_rss(pid):
+    """Resident memory of pid and its live descendants, or None without psutil."""
+    if psutil is None:
+        return None
+    try:
+        parent = psutil.Process(pid)
+        procs = [parent] + parent.children(recursive=True)
+    except psutil.Error:
+        return None
+    rss = 0
+    for proc in procs:
+        try:
+            rss += proc.memory_info().rss
+        except psutil.Error:
+            pass
+    return rss
+
+
+class BuildMetrics:
+    """Counters for a single rebuild.
+
+    Only the build's reader thread writes the output counters, so the hot read
+    loop does plain integer increments without taking a lock. The process
+    usage values are refreshed at scrape time.
+    """
+    RATE_WINDOW = 10  # seconds covered by build_output_lines_per_second
+
+    def __init__(self, build_id, plugin, platform=""):
+        self.build_id = build_id
+        self.plugin = plugin
+        self.platform = platform
+        self.state = "queued"
+        self.queued_at = time.monotonic()
+        self.started_at = None
+        self.pid = None
+        self.lines = 0
+        self.errors = 0
+        self.warnings = 0
+        self.log_enqueued = 0
+        self.cpu_seconds = None
+        self.rss_bytes = None
+        # (time, lines) at most once a second; enough entries to always reach RATE_WINDOW back
+        self._rate_samples = deque(maxlen=self.RATE_WINDOW + 2)
+        self._next_rate_sample = None
+        self._job = None
+        self._job_lock = threading.Lock()
+
+    def start(self, pid):
+        """Mark the build as running under the given child process."""
+        self.pid = pid
+        self.started_at = time.monotonic()
+        self._rate_samples.append((self.started_at, 0))
+        self._next_rate_sample = self.started_at + 1.0
+        if pid:
+            self._job = _open_process_job(pid)
+        self.state = "running"
+
+    def close(self):
+        """Release the Job Object handle once the build is over."""
+        with self._job_lock:
+            if self._job:
+                _kernel32.CloseHandle(self._job)
+                self._job = None
+
+    def count_line(self, line, lower):
+        """Count one line of child stdout (lower is line.lower(), computed once by the caller)."""
+        self.lines += 1
+        now = time.monotonic()
+        if now >= self._next_rate_sample:
+            self._rate_samples.append((now, self.lines))
+            self._next_rate_sample = now + 1.0
+        if "error" in lower or "warning" in lower:
+            match = _DIAGNOSTIC_RE.search(line)
+            if match:
+                if match.group(1).lower() == "error":
+                    self.errors += 1
+                else:
+                    self.warnings += 1
+
+    def elapsed(self, now):
+        """Seconds spent running (or waiting, while still queued)."""
+        return now - (self.started_at if self.started_at is not None else self.queued_at)
+
+    def lines_per_second(self, now):
+        """Line rate over the last RATE_WINDOW seconds (0 during the first second)."""
+        if self.started_at is None or now - self.started_at < 1.0:
+            return 0.0
+        window_start = max(now - self.RATE_WINDOW, self.started_at)
+        # list() copies the deque in one step, so the reader thread can keep appending
+        samples = list(self._rate_samples)
+        # Line count at window_start: the last sample taken at or before it. Samples are
+        # only taken when lines arrive, so a quiet period has no samples but also no lines.
+        lines_then = samples[0][1]
+        for sample_time, sample_lines in samples:
+            if sample_time > window_start:
+                break
+            lines_then = sample_lines
+        return (self.lines - lines_then) / (now - window_start)
+
+    def update_process_usage(self):
+        """Refresh CPU time (Windows Job Object) and resident memory (psutil)."""
+        with self._job_lock:
+            if self._job:
+                cpu = _job_cpu_seconds(self._job)
+                if cpu is not None:
+                    self.cpu_seconds = cpu
+        self.rss_bytes = _process_tree_rss(self.pid) if self.pid else None
+
+
+class MetricsRegistry:
+    """Live build metrics exposed over HTTP in Prometheus text format."""
+    PREFIX = "unreal_rebuilder"
+
+    def __init__(self, logger):
+        self.logger = logger
+        self.builds = {}
+        self.next_build_id = 1
+        # ("build" or "platform_job", outcome) -> count
+        self.finished = {}
+        # Lines queued by finished builds / drawn by the GUI thread; live builds count their own
+        self.log_enqueued_finished = 0
+        self.log_drained = 0
+        self.server = None
+        self._lock = threading.Lock()
+
+    def new_build(self, plugin, platform=""):
+        """Register a queued build and return its BuildMetrics.
+
+        Passing a platform registers one job of a per-platform fan-out; the
+        fan-out itself is registered separately as the build.
+        """
+        with self._lock:
+            build = BuildMetrics(str(self.next_build_id), plugin, platform)
+            self.next_build_id += 1
+            self.builds[build.build_id] = build
+        return build
+
+    def finish_build(self, build, outcome):
+        """Drop a build from the live set; outcome is "success", "failed" or "cancelled"."""
+        key = ("platform_job" if build.platform else "build", outcome)
+        with self._lock:
+            self.builds.pop(build.build_id, None)
+            self.log_enqueued_finished += build.log_enqueued
+            self.finished[key] = self.finished.get(key, 0) + 1
+        build.close()
+
+    def start_server(self, host, port):
+        """Serve /metrics on host:port from a daemon thread. Port 0 disables it."""
+        if not port:
+            return
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                registry.logger.debug("metrics: " + format % args)
+
+        try:
+            self.server = ThreadingHTTPServer((host, port), Handler)
+        except OSError as e:
+            self.logger.warning(f"Metrics endpoint disabled, cannot bind {host}:{port}: {e}")
+            return
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.logger.info(f"Metrics endpoint listening on http://{host}:{port}/metrics")
+
+    def stop_server(self):
+        """Shut down the metrics endpoint if it is running."""
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    @staticmethod
+    def _labels(build):
+        def escape(value):
+            return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        labels = f'build="{build.build_id}",plugin="{escape(build.plugin)}"'
+        if build.platform:
+            labels += f',platform="{escape(build.platform)}"'
+        return labels
+
+    def render(self):
+        """Render all metrics in Prometheus text exposition format."""
+        now = time.monotonic()
+        p = self.PREFIX
+        out = []
+
+        def metric(name, kind, help_text, samples):
+            out.append(f"# HELP {p}_{name} {help_text}")
+            out.append(f"# TYPE {p}_{name} {kind}")
+            for labels, value in samples:
+                out.append(f"{p}_{name}{{{labels}}} {value}" if labels else f"{p}_{name} {value}")
+
+        with self._lock:
+            builds = list(self.builds.values())
+            finished = dict(self.finished)
+            enqueued = self.log_enqueued_finished + sum(b.log_enqueued for b in builds)
+        rebuilds = [b for b in builds if not b.platform]
+        platform_jobs = [b for b in builds if b.platform]
+        # Builds with a child process of their own (not the fan-out that only waits on its jobs)
+        running = [b for b in builds if b.state == "running" and b.pid]
+
+        # Process sampling walks the process list, so it runs outside the lock
+        for b in running:
+            b.update_process_usage()
+
+        def count(kind, *outcomes):
+            return [("", sum(finished.get((kind, outcome), 0) for outcome in outcomes))]
+
+        rebuilds_running = sum(1 for b in rebuilds if b.state == "running")
+        metric("builds_active", "gauge", "Rebuilds currently running.", [("", rebuilds_running)])
+        metric("builds_queued", "gauge", "Rebuilds waiting to start.", [("", len(rebuilds) - rebuilds_running)])
+        metric("builds_completed_total", "counter", "Rebuilds that finished successfully.",
+               count("build", "success"))
+        metric("builds_failed_total", "counter", "Rebuilds that failed or were stopped.",
+               count("build", "failed", "cancelled"))
+
+        jobs_running = sum(1 for b in platform_jobs if b.state == "running")
+        metric("platform_jobs_active", "gauge", "Per-platform jobs of a fan-out currently running.",
+               [("", jobs_running)])
+        metric("platform_jobs_queued", "gauge", "Per-platform jobs waiting for a free slot.",
+               [("", len(platform_jobs) - jobs_running)])
+        metric("platform_jobs_completed_total", "counter", "Per-platform jobs that built successfully.",
+               count("platform_job", "success"))
+        metric("platform_jobs_failed_total", "counter", "Per-platform jobs that failed.",
+               count("platform_job", "failed"))
+        metric("platform_jobs_cancelled_total", "counter", "Per-platform jobs stopped or skipped by the user.",
+               count("platform_job", "cancelled"))
+        metric("build_elapsed_seconds", "gauge", "Time since the build started (or was queued).",
+               [(self._labels(b), f"{b.elapsed(now):.3f}") for b in builds])
+        metric("build_output_lines_total", "counter", "Lines read from the build's stdout.",
+               [(self._labels(b), b.lines) for b in running])
+        metric("build_output_lines_per_second", "gauge",
+               f"Stdout line rate over the last {BuildMetrics.RATE_WINDOW} seconds (0 in the first second).",
+               [(self._labels(b), f"{b.lines_per_second(now):.3f}") for b in running])
+        metric("build_errors_total", "counter", "Error diagnostics parsed from build output.",
+               [(self._labels(b), b.errors) for b in running])
+        metric("build_warnings_total", "counter", "Warning diagnostics parsed from build output.",
+               [(self._labels(b), b.warnings) for b in running])
+        metric("build_process_cpu_seconds_total", "counter",
+               "CPU time of every process the build started, including exited ones (Windows only).",
+               [(self._labels(b), f"{b.cpu_seconds:.3f}") for b in running if b.cpu_seconds is not None])
+        metric("build_process_rss_bytes", "gauge",
+               "Resident memory of the build's live child process tree (needs psutil).",
+               [(self._labels(b), b.rss_bytes) for b in running if b.rss_bytes is not None])
+        metric("gui_log_queue_depth", "gauge", "Output lines waiting to be drawn by the GUI thread.",
+               [("", max(enqueued - self.log_drained, 0))])
+
+        return "\n".join(out) + "\n"
+
+
 class UnrealPluginRebuilder:
     def __init__(self, root):
         """Initialize the Unreal Plugin Rebuilder GUI application."""
@@ -65,6 +409,9 @@ class UnrealPluginRebuilder:
         self.runuat_path = tk.StringVar()
         self.output_path = tk.StringVar()
         self.engine_version = tk.StringVar()
+        self.target_platforms = tk.StringVar()
+        self.parallel_platforms = tk.BooleanVar(value=False)
+        self.max_parallel_jobs = tk.IntVar(value=2)
         self.status_text = tk.StringVar(value="Ready")
 
         # Platform-specific settings
@@ -79,12 +426,24 @@ class UnrealPluginRebuilder:
         self.progress_bar = None
         self.output_text = None  # Initialize to None
         self.open_folder_btn = None
+        self.retry_button = None
         self.last_output_folder = None
 
+        # Per-platform fan-out job (kept after a failure so it can be retried)
+        self.platform_job = None
+
         # Config file for remembering paths
         self.config_file = "rebuilder_config.json"
         self.recent_paths = self._load_config()
 
+        # Live metrics endpoint (set "metrics_port" to 0 in the config to disable)
+        self.metrics_port = self._get_metrics_port()
+        self.metrics = MetricsRegistry(self.logger)
+        self.metrics.start_server("127.0.0.1", self.metrics_port)
+        if psutil is None:
+            self.logger.warning("psutil is not installed; build memory metrics are disabled")
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
         # Get available Unreal Engine versions
         self.engine_versions = self._get_engine_versions()
         if not self.engine_versions:
@@ -109,13 +468,29 @@ class UnrealPluginRebuilder:
             self.logger.error(f"Error loading config: {e}")
         return {}
 
+    def _get_metrics_port(self):
+        """Read the metrics port from the config, disabling the endpoint if it is invalid."""
+        value = self.recent_paths.get('metrics_port', 9109)
+        try:
+            port = int(value)
+        except (TypeError, ValueError):
+            port = -1
+        if not 0 <= port <= 65535:
+            self.logger.warning(f"Invalid metrics_port {value!r} in config; metrics endpoint disabled")
+            return 0
+        return port
+
     def _save_config(self):
         """Save recent paths to config file."""
         try:
             config = {
                 'last_uplugin': self.uplugin_path.get(),
                 'last_output': self.output_path.get(),
-                'last_engine': self.engine_version.get()
+                'last_engine': self.engine_version.get(),
+                'last_platforms': self.target_platforms.get(),
+                'parallel_platforms': self.parallel_platforms.get(),
+                'max_parallel_jobs': self._get_max_parallel_jobs(),
+                'metrics_port': self.metrics_port
             }
             with open(self.config_file, 'w') as f:
                 json.dump(config, f)
@@ -136,6 +511,10 @@ class UnrealPluginRebuilder:
             self.engine_version.set(self.recent_paths['last_engine'])
             self._on_engine_select(None)
 
+        self.target_platforms.set(self.recent_paths.get('last_platforms', ''))
+        self.parallel_platforms.set(bool(self.recent_paths.get('parallel_platforms', False)))
+        self.max_parallel_jobs.set(self.recent_paths.get('max_parallel_jobs', 2))
+
     def _set_default_engine(self):
         """Set default engine version to the latest one."""
         if self.engine_versions and self.engine_versions[0] != "No Unreal Engine versions found":
@@ -303,6 +682,18 @@ class UnrealPluginRebuilder:
                                      fg="#7f8c8d", wraplength=700, anchor="w")
         output_path_label.pack(fill="x", padx=(20, 0), pady=(0, 5))
 
+        # Target Platforms
+        platforms_frame = tk.Frame(file_frame, bg="#f0f0f0")
+        platforms_frame.pack(fill="x", pady=5)
+
+        tk.Label(platforms_frame, text="Target Platforms:", font=("Arial", 10, "bold"),
+                bg="#f0f0f0", width=15, anchor="w").pack(side="left", padx=(0, 10))
+
+        platforms_entry = tk.Entry(platforms_frame, textvariable=self.target_platforms,
+                                   font=("Arial", 9), width=28)
+        platforms_entry.pack(side="left", padx=5)
+        ToolTip(platforms_entry, "Platforms separated by '+', e.g. Win64+Android (empty = engine default)")
+
         # ===== BUILD CONTROL FRAME =====
         control_frame = tk.LabelFrame(content_frame, text="⚙️ Build Control", 
                                      font=("Arial", 11, "bold"), bg="#f0f0f0", 
@@ -320,6 +711,24 @@ class UnrealPluginRebuilder:
                                            style="Custom.Horizontal.TProgressbar")
         self.progress_bar.pack(fill="x", pady=(0, 10))
 
+        # Parallel platform options
+        parallel_frame = tk.Frame(control_frame, bg="#f0f0f0")
+        parallel_frame.pack(pady=(0, 10))
+
+        parallel_check = tk.Checkbutton(parallel_frame, text="Build platforms in parallel",
+                                        variable=self.parallel_platforms, bg="#f0f0f0",
+                                        font=("Arial", 9))
+        parallel_check.pack(side="left", padx=5)
+        ToolTip(parallel_check, "Run one BuildPlugin per target platform and merge the results")
+
+        tk.Label(parallel_frame, text="Max jobs:", font=("Arial", 9),
+                bg="#f0f0f0").pack(side="left", padx=(10, 0))
+
+        jobs_spinbox = tk.Spinbox(parallel_frame, from_=1, to=16, width=4,
+                                  textvariable=self.max_parallel_jobs, font=("Arial", 9))
+        jobs_spinbox.pack(side="left", padx=5)
+        ToolTip(jobs_spinbox, "How many platforms are built at the same time")
+
         # Buttons Frame
         btn_frame = tk.Frame(control_frame, bg="#f0f0f0")
         btn_frame.pack()
@@ -339,6 +748,14 @@ class UnrealPluginRebuilder:
         self.open_folder_btn.grid(row=0, column=1, padx=5)
         ToolTip(self.open_folder_btn, "Open the output folder after successful build")
 
+        self.retry_button = tk.Button(btn_frame, text="🔁 Retry Failed Platforms",
+                                      command=self._retry_failed_platforms,
+                                      bg="#95a5a6", fg="white",
+                                      font=("Arial", 10), width=22,
+                                      state="disabled", cursor="hand2")
+        self.retry_button.grid(row=0, column=2, padx=5)
+        ToolTip(self.retry_button, "Rebuild only the platforms that failed, then merge")
+
         # ===== BUILD OUTPUT FRAME =====
         output_frame = tk.LabelFrame(content_frame, text="📋 Build Output", 
                                     font=("Arial", 11, "bold"), bg="#f0f0f0", 
@@ -387,6 +804,11 @@ class UnrealPluginRebuilder:
             self.output_text.see("end")
             self.root.update_idletasks()
 
+    def _log_build_line(self, message, tag=""):
+        """Add a queued line of build output and mark it drained for the metrics."""
+        self.metrics.log_drained += 1
+        self._log_output(message, tag)
+
     def _update_status(self, message):
         """Update status bar message."""
         self.status_text.set(message)
@@ -485,6 +907,38 @@ class UnrealPluginRebuilder:
         """Check if the output folder contains a .uplugin file."""
         return any(Path(output).glob("*.uplugin"))
 
+    def _parse_platforms(self):
+        """Split the target platforms field into a list, or None if a name is invalid."""
+        platforms = []
+        for name in re.split(r"[+,;\s]+", self.target_platforms.get().strip()):
+            if not name:
+                continue
+            if not re.match(r"^[A-Za-z0-9_]+$", name):
+                return None
+            if name not in platforms:
+                platforms.append(name)
+        return platforms
+
+    def _get_max_parallel_jobs(self):
+        """Read the max parallel jobs setting, falling back to 1 on bad input."""
+        try:
+            return max(1, int(self.max_parallel_jobs.get()))
+        except (tk.TclError, ValueError):
+            return 1
+
+    def _build_command(self, runuat: str, uplugin: str, output: str, platforms,
+                       parallel=False, no_host_platform=False) -> str:
+        """Construct the BuildPlugin command line."""
+        command = f'"{runuat}" BuildPlugin -Plugin="{uplugin}" -Package="{output}"'
+        if platforms:
+            command += f' -TargetPlatforms={"+".join(platforms)}'
+        if no_host_platform:
+            command += " -NoHostPlatform"
+        if parallel:
+            # AutomationTool refuses a second instance per engine install without this
+            command += " -NoMutex"
+        return command if self.is_windows else f"sh {command}"
+
     def _toggle_rebuild(self):
         """Toggle between starting and stopping the rebuild process."""
         if not self.is_rebuilding:
@@ -526,6 +980,12 @@ class UnrealPluginRebuilder:
             messagebox.showerror("Invalid Engine", f"RunUAT{self.runuat_extension} not found for the selected engine.")
             return
 
+        platforms = self._parse_platforms()
+        if platforms is None:
+            messagebox.showerror("Invalid Platforms",
+                               "Target platforms must be names like Win64, Linux or Android, separated by '+'.")
+            return
+
         # Create output folder
         try:
             plugin_folder_name = os.path.basename(os.path.dirname(uplugin))
@@ -550,31 +1010,60 @@ class UnrealPluginRebuilder:
         # Save config
         self._save_config()
 
-        # Update UI
+        self.retry_button.config(state="disabled", bg="#95a5a6")
+        self._begin_build_ui("Starting build process...", uplugin, self.engine_version.get(), output, platforms)
+
+        # Run rebuild in separate thread
+        if self.parallel_platforms.get() and len(platforms) > 1:
+            host_platform = {"Windows": "Win64", "Darwin": "Mac"}.get(platform.system(), "Linux")
+            self.platform_job = {
+                'uplugin': uplugin,
+                'runuat': runuat,
+                'engine_version': self.engine_version.get(),
+                'output': output,
+                'staging_root': f"{output}_PlatformStaging",
+                'merge_dir': f"{output}_PlatformMerge",
+                'backup_dir': f"{output}_PlatformBackup",
+                'platforms': platforms,
+                # Only this job builds the host editor binaries; the others pass -NoHostPlatform
+                'host_job': host_platform if host_platform in platforms else platforms[0],
+                'succeeded': set(),
+                'max_jobs': self._get_max_parallel_jobs(),
+                'cancel': threading.Event(),
+                'processes': {},
+                # None: nothing to retry, []: merge only, otherwise the platforms to rebuild
+                'retry': None
+            }
+            threading.Thread(target=self._run_platform_fanout, args=(self.platform_job, platforms, True),
+                             daemon=True).start()
+        else:
+            self.platform_job = None
+            build_metrics = self.metrics.new_build(os.path.basename(uplugin))
+            threading.Thread(target=self._run_rebuild_process,
+                             args=(uplugin, runuat, output, platforms, build_metrics), daemon=True).start()
+
+    def _begin_build_ui(self, title, uplugin, engine_version, output, platforms):
+        """Switch the UI into building mode and print the build header."""
         self.is_rebuilding = True
         self.start_button.config(text="⏹ Stop Build", bg="#e74c3c")
         self.progress_bar.start(10)
         self.root.config(cursor="wait")
         self.output_text.delete("1.0", "end")
         self._log_output(f"{'='*60}", "info")
-        self._log_output(f"Starting build process...", "info")
+        self._log_output(title, "info")
         self._log_output(f"Plugin: {os.path.basename(uplugin)}", "info")
-        self._log_output(f"Engine: UE {self.engine_version.get()}", "info")
+        self._log_output(f"Engine: UE {engine_version}", "info")
+        if platforms:
+            self._log_output(f"Platforms: {', '.join(platforms)}", "info")
         self._log_output(f"Output: {output}", "info")
         self._log_output(f"{'='*60}\n", "info")
         self._update_status("Building plugin... Please wait")
 
-        # Run rebuild in separate thread
-        threading.Thread(target=self._run_rebuild_process, args=(uplugin, runuat, output), daemon=True).start()
-
-    def _run_rebuild_process(self, uplugin: str, runuat: str, output: str):
+    def _run_rebuild_process(self, uplugin: str, runuat: str, output: str, platforms, build_metrics: BuildMetrics):
         """Run the rebuild process in a separate thread."""
+        success = False
         try:
-            # Construct command
-            if self.is_windows:
-                command = f'"{runuat}" BuildPlugin -Plugin="{uplugin}" -Package="{output}"'
-            else:
-                command = f'sh "{runuat}" BuildPlugin -Plugin="{uplugin}" -Package="{output}"'
+            command = self._build_command(runuat, uplugin, output, platforms)
 
             self.logger.info(f"Executing command: {command}")
 
@@ -589,16 +1078,22 @@ class UnrealPluginRebuilder:
                 universal_newlines=True
             )
 
+            build_metrics.start(self.process.pid)
+
             # Read output in real-time
             for line in iter(self.process.stdout.readline, ''):
                 if line:
-                    tag = "error" if "error" in line.lower() or "fail" in line.lower() else ""
-                    self.root.after(0, lambda l=line, t=tag: self._log_output(l.rstrip(), t))
+                    lower = line.lower()
+                    build_metrics.count_line(line, lower)
+                    tag = "error" if "error" in lower or "fail" in lower else ""
+                    build_metrics.log_enqueued += 1
+                    self.root.after(0, lambda l=line, t=tag: self._log_build_line(l.rstrip(), t))
 
             self.process.wait()
 
             # Check result
             if self.process.returncode == 0:
+                success = True
                 self.root.after(0, self._on_build_success)
             else:
                 self.root.after(0, lambda: self._on_build_failure("Build process failed. Check output above."))
@@ -606,8 +1101,278 @@ class UnrealPluginRebuilder:
         except Exception as e:
             self.root.after(0, lambda: self._on_build_failure(f"Error during build: {str(e)}"))
         finally:
+            self.metrics.finish_build(build_metrics, "success" if success else "failed")
             self.root.after(0, self._reset_ui)
 
+    def _run_platform_fanout(self, job, platforms, clean_staging=False):
+        """Build each platform as its own job under the concurrency limit, then merge.
+
+        Runs on a worker thread. Stopping is signalled through the job's own
+        cancel event, so a stopped fan-out can never touch a newer build.
+        """
+        cancel = job['cancel']
+        plugin_name = os.path.basename(job['uplugin'])
+        fanout_metrics = self.metrics.new_build(plugin_name)
+        fanout_metrics.start(None)
+        outcome = "failed"
+        try:
+            if clean_staging:
+                shutil.rmtree(job['staging_root'], ignore_errors=True)
+
+            results = {}
+            if platforms:
+                # Register every job up front so waiting platforms show up as queued
+                jobs = {name: self.metrics.new_build(plugin_name, name) for name in platforms}
+                with ThreadPoolExecutor(max_workers=min(job['max_jobs'], len(platforms))) as pool:
+                    futures = {pool.submit(self._run_platform_job, job, name, jobs[name]): name
+                               for name in platforms}
+                    for future in as_completed(futures):
+                        name = futures[future]
+                        try:
+                            results[name] = future.result()
+                        except Exception as e:
+                            self.logger.error(f"[{name}] Platform job crashed: {str(e)}")
+                            results[name] = "failed"
+
+                # A platform that lost the engine lock to another job gets one more run on its own
+                for name in [name for name in platforms if results[name] == "conflict"]:
+                    if cancel.is_set():
+                        break
+                    message = f"[{name}] Another AutomationTool/UBT instance held the engine lock; retrying alone"
+                    self.logger.warning(message)
+                    self._fanout_callback(job, lambda m=message: self._log_output(m, "info"))
+                    results[name] = self._run_platform_job(job, name, self.metrics.new_build(plugin_name, name))
+
+            if cancel.is_set():
+                outcome = "cancelled"
+                shutil.rmtree(job['staging_root'], ignore_errors=True)
+                return
+
+            failed = [name for name in platforms if results.get(name) != "success"]
+            if failed:
+                self._fanout_callback(job, lambda: self._on_platforms_failed(job, failed))
+                return
+
+            try:
+                merged = self._merge_platform_staging(job)
+                if merged is not None and not cancel.is_set():
+                    self._swap_in_merged_output(job)
+                    merged_in = True
+                else:
+                    merged_in = False
+            except Exception as e:
+                shutil.rmtree(job['merge_dir'], ignore_errors=True)
+                message = f"Error during platform merge: {str(e)}"
+                self.logger.error(message)
+                self._fanout_callback(job, lambda: self._on_merge_failed(job, message))
+                return
+
+            if not merged_in:
+                outcome = "cancelled"
+                shutil.rmtree(job['merge_dir'], ignore_errors=True)
+                shutil.rmtree(job['staging_root'], ignore_errors=True)
+                return
+
+            copied, deduplicated, conflicts = merged
+            for rel_path, platform_name in conflicts:
+                self.logger.warning(f"Merge kept first copy of {rel_path}; {platform_name} produced a different file")
+            summary = (f"Merged {len(job['platforms'])} platforms: {copied} files copied, "
+                       f"{deduplicated} shared files deduplicated, {len(conflicts)} conflicting copies skipped")
+            self.logger.info(summary)
+            shutil.rmtree(job['staging_root'], ignore_errors=True)
+            outcome = "success"
+            self._fanout_callback(job, lambda: self._on_fanout_success(job, summary))
+
+        except Exception as e:
+            message = f"Error during platform build: {str(e)}"
+            self._fanout_callback(job, lambda: self._on_build_failure(message))
+        finally:
+            self.metrics.finish_build(fanout_metrics, outcome)
+            self._fanout_callback(job, self._reset_ui)
+
+    def _fanout_callback(self, job, callback):
+        """Run callback on the GUI thread unless the fan-out has been stopped by then."""
+        cancel = job['cancel']
+        self.root.after(0, lambda: None if cancel.is_set() else callback())
+
+    def _run_platform_job(self, job, platform_name: str, build_metrics: BuildMetrics) -> str:
+        """Run BuildPlugin for a single platform into its own staging folder.
+
+        Returns "success", "failed", "conflict" (another instance held the
+        engine lock) or "cancelled".
+        """
+        cancel = job['cancel']
+        staging = os.path.join(job['staging_root'], platform_name)
+        prefix = f"[{platform_name}] "
+        outcome = "cancelled"
+        try:
+            # Skip jobs still queued when the user pressed stop
+            if cancel.is_set():
+                return outcome
+
+            shutil.rmtree(staging, ignore_errors=True)
+            os.makedirs(staging, exist_ok=True)
+            command = self._build_command(job['runuat'], job['uplugin'], staging, [platform_name], parallel=True,
+                                          no_host_platform=platform_name != job['host_job'])
+            self.logger.info(f"{prefix}Executing command: {command}")
+
+            process = subprocess.Popen(
+                command,
+                shell=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                universal_newlines=True
+            )
+            job['processes'][platform_name] = process
+            if cancel.is_set():
+                self._kill_process(process)
+            build_metrics.start(process.pid)
+
+            lock_conflict = False
+            for line in iter(process.stdout.readline, ''):
+                if line:
+                    lower = line.lower()
+                    build_metrics.count_line(line, lower)
+                    if "conflicting instance" in lower:
+                        lock_conflict = True
+                    tag = "error" if "error" in lower or "fail" in lower else ""
+                    build_metrics.log_enqueued += 1
+                    self.root.after(0, lambda l=prefix + line, t=tag: self._log_build_line(l.rstrip(), t))
+
+            process.wait()
+            if cancel.is_set():
+                outcome = "cancelled"
+            elif process.returncode == 0:
+                outcome = "success"
+                job['succeeded'].add(platform_name)
+            else:
+                outcome = "conflict" if lock_conflict else "failed"
+            return outcome
+
+        except Exception:
+            outcome = "failed"
+            raise
+        finally:
+            job['processes'].pop(platform_name, None)
+            self.metrics.finish_build(build_metrics, "failed" if outcome == "conflict" else outcome)
+            status = {
+                "success": (f"{prefix}✓ Platform finished", "success"),
+                "failed": (f"{prefix}✗ Platform failed", "error"),
+                "conflict": (f"{prefix}⚠ Engine lock held by another instance", "info"),
+            }.get(outcome)
+            if status:
+                self._fanout_callback(job, lambda: self._log_output(*status))
+
+    def _merge_platform_staging(self, job):
+        """Merge per-platform staging folders into a fresh merge folder next to the output.
+
+        Returns (copied, deduplicated, conflicts), or None if the build was
+        stopped. Raises ValueError if the plugin descriptors produced by the
+        platforms do not agree.
+        """
+        cancel = job['cancel']
+        staging_dirs = [(name, os.path.join(job['staging_root'], name)) for name in job['platforms']]
+
+        # The descriptors must agree before anything is copied
+        descriptors = {}
+        for name, staging in staging_dirs:
+            found = list(Path(staging).glob("*.uplugin"))
+            if len(found) != 1:
+                raise ValueError(f"{name}: expected one .uplugin in {staging}, found {len(found)}")
+            with open(found[0], 'r', encoding='utf-8-sig') as f:
+                descriptors[name] = {'FileName': found[0].name, **json.load(f)}
+
+        reference_name, reference = next(iter(descriptors.items()))
+        for name, descriptor in descriptors.items():
+            if descriptor != reference:
+                keys = sorted(k for k in set(reference) | set(descriptor) if reference.get(k) != descriptor.get(k))
+                raise ValueError(f"Plugin descriptor from {name} differs from {reference_name} in: {', '.join(keys)}")
+
+        shutil.rmtree(job['merge_dir'], ignore_errors=True)
+        os.makedirs(job['merge_dir'])
+
+        # Files shared between platforms (e.g. resources, content) are copied once
+        sources = {}
+        copied, deduplicated = 0, 0
+        conflicts = []
+        for name, staging in staging_dirs:
+            for dirpath, _, filenames in os.walk(staging):
+                if cancel.is_set():
+                    return None
+                for filename in filenames:
+                    src = os.path.join(dirpath, filename)
+                    rel_path = os.path.relpath(src, staging)
+                    if rel_path in sources:
+                        if filecmp.cmp(sources[rel_path], src, shallow=False):
+                            deduplicated += 1
+                        else:
+                            conflicts.append((rel_path, name))
+                        continue
+                    dest = os.path.join(job['merge_dir'], rel_path)
+                    os.makedirs(os.path.dirname(dest), exist_ok=True)
+                    shutil.copy2(src, dest)
+                    sources[rel_path] = src
+                    copied += 1
+        return copied, deduplicated, conflicts
+
+    def _swap_in_merged_output(self, job):
+        """Replace the output folder with the merged tree, restoring the old one on failure."""
+        output, merged, backup = job['output'], job['merge_dir'], job['backup_dir']
+        shutil.rmtree(backup, ignore_errors=True)
+        had_output = os.path.exists(output)
+        if had_output:
+            # Fails up front, with the old package untouched, if something holds a file open
+            os.rename(output, backup)
+        try:
+            os.rename(merged, output)
+        except OSError:
+            if had_output:
+                os.rename(backup, output)
+            raise
+        shutil.rmtree(backup, ignore_errors=True)
+
+    def _on_fanout_success(self, job, summary):
+        """Handle a fan-out whose platforms all built and merged."""
+        if self.platform_job is job:
+            self.platform_job = None
+        self._log_output(summary, "info")
+        self._on_build_success()
+
+    def _on_platforms_failed(self, job, failed):
+        """Report failed platforms and allow retrying only those."""
+        job['retry'] = failed
+        self.retry_button.config(text="🔁 Retry Failed Platforms", state="normal", bg="#e67e22")
+        succeeded = [name for name in job['platforms'] if name in job['succeeded']]
+        self._on_build_failure(f"Failed platform(s): {', '.join(failed)}\n"
+                               f"Succeeded: {', '.join(succeeded) or 'none'}\n\n"
+                               f"Use 'Retry Failed Platforms' to rebuild only the failed ones.")
+
+    def _on_merge_failed(self, job, message):
+        """Report a failed merge and allow merging again from the kept staging folders."""
+        job['retry'] = []
+        self.retry_button.config(text="🔁 Retry Merge", state="normal", bg="#e67e22")
+        self._log_output(f"Staging folders kept in {job['staging_root']}", "info")
+        self._on_build_failure(f"{message}\n\nAll platforms built; their staging folders were kept.\n"
+                               f"Use 'Retry Merge' to merge again without rebuilding.")
+
+    def _retry_failed_platforms(self):
+        """Rebuild the platforms that failed last time (or only redo the merge)."""
+        job = self.platform_job
+        if self.is_rebuilding or job is None or job['retry'] is None:
+            return
+        platforms = job['retry']
+        job['retry'] = None
+        job['cancel'] = threading.Event()
+        job['max_jobs'] = self._get_max_parallel_jobs()
+        self.retry_button.config(text="🔁 Retry Failed Platforms", state="disabled", bg="#95a5a6")
+        self.last_output_folder = job['output']
+        title = "Retrying failed platforms..." if platforms else "Retrying platform merge..."
+        self._begin_build_ui(title, job['uplugin'], job['engine_version'], job['output'], platforms or job['platforms'])
+        self.logger.info(title if not platforms else f"Retrying failed platforms: {', '.join(platforms)}")
+        threading.Thread(target=self._run_platform_fanout, args=(job, platforms), daemon=True).start()
+
     def _on_build_success(self):
         """Handle successful build."""
         self._log_output("\n" + "="*60, "success")
@@ -630,7 +1395,9 @@ class UnrealPluginRebuilder:
 
     def _stop_rebuild(self):
         """Stop the running rebuild process."""
-        if self.process and self.is_rebuilding:
+        if (self.process or self.platform_job is not None) and self.is_rebuilding:
+            if self.platform_job is not None:
+                self.platform_job['cancel'].set()
             self._terminate_process()
             self._log_output("\n⚠ Build stopped by user", "error")
             self._update_status("Build stopped")
@@ -639,18 +1406,30 @@ class UnrealPluginRebuilder:
         self._reset_ui()
 
     def _terminate_process(self):
-        """Safely terminate the running process."""
+        """Safely terminate the running process and any per-platform jobs."""
+        processes = list(self.platform_job['processes'].values()) if self.platform_job else []
         if self.process:
+            processes.append(self.process)
+        # Signal everything first so the waits below overlap instead of adding up
+        for process in processes:
+            self._kill_process(process)
+        deadline = time.monotonic() + 5
+        for process in processes:
             try:
-                if self.is_windows:
-                    subprocess.run(f"taskkill /PID {self.process.pid} /T /F", shell=True)
-                else:
-                    self.process.send_signal(signal.SIGTERM)
-                self.process.wait(timeout=5)
+                process.wait(timeout=max(0.0, deadline - time.monotonic()))
             except Exception as e:
                 self.logger.error(f"Error terminating process: {str(e)}")
-            finally:
-                self.process = None
+        self.process = None
+
+    def _kill_process(self, process):
+        """Send the terminate signal to a single child process without waiting."""
+        try:
+            if self.is_windows:
+                subprocess.run(f"taskkill /PID {process.pid} /T /F", shell=True)
+            else:
+                process.send_signal(signal.SIGTERM)
+        except Exception as e:
+            self.logger.error(f"Error terminating process: {str(e)}")
 
     def _reset_ui(self):
         """Reset the UI after rebuild."""
@@ -677,6 +1456,11 @@ class UnrealPluginRebuilder:
                 messagebox.showerror("Error", f"Could not open folder:\n{str(e)}")
                 self.logger.error(f"Error opening folder: {str(e)}")
 
+    def _on_close(self):
+        """Shut down the metrics endpoint and close the window."""
+        self.metrics.stop_server()
+        self.root.destroy()
+
 
 if __name__ == "__main__":
     try: